@@ -0,0 +1,182 @@
+import types
+
+import pytest
+import yaml
+
+from validation_scheduler import FAILED, NO_SUITE, PASSED, SKIPPED, ValidationScheduler
+
+
+def write_lineage(tmp_path, edges):
+    """Write a lineage.yaml with one source -> target entry per edge."""
+    lineages = [
+        {
+            "source": {"platform": "postgres", "dataset": source},
+            "target": {"platform": "postgres", "dataset": target},
+            "field_mappings": [],
+        }
+        for source, target in edges
+    ]
+    path = tmp_path / "lineage.yaml"
+    path.write_text(yaml.safe_dump({"lineages": lineages}))
+    return path
+
+
+def make_scheduler(lineage_path, datasets, failing=(), max_workers=1):
+    """Return a scheduler whose suites record the order they ran in."""
+    calls = []
+
+    def prepare_suite(dataset):
+        calls.append(("prepare", dataset))
+        return dataset
+
+    def run_suite(dataset):
+        calls.append(("run", dataset))
+        return types.SimpleNamespace(success=dataset not in failing)
+
+    scheduler = ValidationScheduler(
+        validation_suites={dataset: dataset for dataset in datasets},
+        prepare_suite=prepare_suite,
+        run_suite=run_suite,
+        lineage_path=lineage_path,
+        max_workers=max_workers,
+    )
+    return scheduler, calls
+
+
+@pytest.fixture
+def lineage_path(tmp_path):
+    # Mirrors emit_lineage/lineage.yaml
+    return write_lineage(tmp_path, [
+        ("postgres.public.customers", "postgres.public.client"),
+        ("postgres.public.pos_sales", "postgres.public.orders"),
+        ("postgres.public.erp_orders", "postgres.public.orders"),
+    ])
+
+
+SUITES = [
+    "postgres.public.client",
+    "postgres.public.orders",
+    "postgres.public.pos_sales",
+    "postgres.public.erp_orders",
+]
+
+
+def test_runs_upstream_before_downstream(lineage_path):
+    scheduler, calls = make_scheduler(lineage_path, SUITES)
+    statuses = scheduler.run()
+
+    runs = [dataset for call, dataset in calls if call == "run"]
+    assert runs.index("postgres.public.pos_sales") < runs.index("postgres.public.orders")
+    assert runs.index("postgres.public.erp_orders") < runs.index("postgres.public.orders")
+    assert statuses["postgres.public.customers"] == NO_SUITE
+    assert all(statuses[dataset] == PASSED for dataset in SUITES)
+
+
+def test_failed_expectations_skip_downstream_without_preparing_it(lineage_path):
+    scheduler, calls = make_scheduler(lineage_path, SUITES, failing={"postgres.public.pos_sales"})
+    statuses = scheduler.run()
+
+    assert statuses["postgres.public.pos_sales"] == FAILED
+    assert statuses["postgres.public.orders"] == SKIPPED
+    assert statuses["postgres.public.client"] == PASSED
+    assert ("prepare", "postgres.public.orders") not in calls
+
+
+def test_prepare_error_fails_suite_and_other_branches_still_run(lineage_path):
+    def prepare_suite(dataset):
+        if dataset == "postgres.public.erp_orders":
+            raise RuntimeError("boom")
+        return dataset
+
+    scheduler = ValidationScheduler(
+        validation_suites={dataset: dataset for dataset in SUITES},
+        prepare_suite=prepare_suite,
+        run_suite=lambda dataset: None,
+        lineage_path=lineage_path,
+    )
+    statuses = scheduler.run()
+
+    assert statuses["postgres.public.erp_orders"] == FAILED
+    assert statuses["postgres.public.orders"] == SKIPPED
+    assert statuses["postgres.public.pos_sales"] == PASSED
+    assert statuses["postgres.public.client"] == PASSED
+
+
+def test_skip_propagates_through_tables_without_a_suite(tmp_path):
+    lineage_path = write_lineage(tmp_path, [
+        ("postgres.public.raw", "postgres.public.staged"),
+        ("postgres.public.staged", "postgres.public.report"),
+    ])
+    scheduler, _ = make_scheduler(
+        lineage_path,
+        ["postgres.public.raw", "postgres.public.report"],
+        failing={"postgres.public.raw"},
+    )
+    statuses = scheduler.run()
+
+    assert statuses == {
+        "postgres.public.raw": FAILED,
+        "postgres.public.staged": SKIPPED,
+        "postgres.public.report": SKIPPED,
+    }
+
+
+def test_changed_tables_runs_only_downstream_subgraph(lineage_path):
+    scheduler, calls = make_scheduler(lineage_path, SUITES)
+    statuses = scheduler.run(changed_tables="erp_orders")
+
+    assert statuses == {
+        "postgres.public.erp_orders": PASSED,
+        "postgres.public.orders": PASSED,
+    }
+    assert {dataset for _, dataset in calls} == set(statuses)
+
+
+def test_changed_tables_accepts_qualified_names_and_lists(lineage_path):
+    scheduler, _ = make_scheduler(lineage_path, SUITES)
+
+    assert scheduler.affected_datasets(["public.customers", "postgres.public.pos_sales"]) == {
+        "postgres.public.customers",
+        "postgres.public.client",
+        "postgres.public.pos_sales",
+        "postgres.public.orders",
+    }
+
+
+def test_changed_tables_unknown_or_ambiguous(tmp_path):
+    lineage_path = write_lineage(tmp_path, [
+        ("postgres.public.orders", "postgres.reporting.orders"),
+    ])
+    scheduler, _ = make_scheduler(lineage_path, [])
+
+    with pytest.raises(ValueError, match="not found"):
+        scheduler.run(changed_tables="nope")
+    with pytest.raises(ValueError, match="ambiguous"):
+        scheduler.run(changed_tables="orders")
+    assert scheduler.resolve_dataset("reporting.orders") == "postgres.reporting.orders"
+
+
+def test_suite_not_in_lineage_runs_without_dependencies(lineage_path):
+    scheduler, _ = make_scheduler(lineage_path, SUITES + ["postgres.staging.extra"])
+
+    assert scheduler.run()["postgres.staging.extra"] == PASSED
+
+
+def test_cycle_is_rejected(tmp_path):
+    lineage_path = write_lineage(tmp_path, [
+        ("postgres.public.a", "postgres.public.b"),
+        ("postgres.public.b", "postgres.public.a"),
+    ])
+
+    with pytest.raises(ValueError, match="cycle"):
+        make_scheduler(lineage_path, [])
+
+
+def test_stalled_schedule_raises_instead_of_spinning(lineage_path):
+    scheduler, _ = make_scheduler(lineage_path, SUITES)
+    # Introduce a cycle after construction so no dataset can become ready
+    scheduler.upstreams["postgres.public.pos_sales"].add("postgres.public.orders")
+    scheduler.downstreams["postgres.public.orders"].add("postgres.public.pos_sales")
+
+    with pytest.raises(RuntimeError, match="postgres.public.orders"):
+        scheduler.run(changed_tables="pos_sales")
@@ -0,0 +1,211 @@
+"""
+Dependency-aware scheduler for the Great Expectations validation suites.
+
+Reads the compiled lineage (emit_lineage/lineage.yaml) to build a dataset-level
+DAG and runs each dataset's validation suite in topological order. Independent
+branches can run in parallel when suites share no state, downstream suites are
+skipped when an upstream suite fails, and a run can be limited to the subgraph
+downstream of one or more changed tables.
+"""
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+
+import yaml
+
+DEFAULT_LINEAGE_PATH = Path(__file__).parent.parent / "emit_lineage" / "lineage.yaml"
+
+PASSED = "passed"
+FAILED = "failed"
+SKIPPED = "skipped"
+NO_SUITE = "no_suite"
+
+
+def dataset_name(database_name: str, schema_name: str, table_name: str) -> str:
+    """Return a dataset name in the lineage.yaml format, e.g. postgres.public.client."""
+    return f"{database_name}.{schema_name}.{table_name}"
+
+
+def load_lineage_graph(file_path=DEFAULT_LINEAGE_PATH) -> dict:
+    """Load lineage.yaml and return a mapping of dataset -> set of upstream datasets."""
+    with open(file_path, 'r') as file:
+        lineage_data = yaml.safe_load(file)
+
+    upstreams = {}
+    for lineage in lineage_data.get('lineages', []):
+        source = lineage['source']['dataset']
+        target = lineage['target']['dataset']
+        upstreams.setdefault(source, set())
+        upstreams.setdefault(target, set()).add(source)
+    return upstreams
+
+
+class ValidationScheduler:
+    def __init__(self, validation_suites: dict, prepare_suite, run_suite, lineage_path=DEFAULT_LINEAGE_PATH, max_workers: int = 1):
+        """
+        validation_suites maps a dataset name (database.schema.table) to a suite
+        config. prepare_suite(suite) is called on the scheduler thread just
+        before the suite is submitted and returns what run_suite needs;
+        run_suite(prepared) runs on a worker and returns a result. The suite
+        fails if either call raises or the result has success set to False.
+
+        A suite is only prepared while a worker is free, so with the default
+        max_workers=1 no two calls ever overlap. Only raise max_workers when
+        run_suite calls share no state; GX checkpoints sharing a DataContext
+        do, so the validation framework always runs with one worker.
+        """
+        self.validation_suites = validation_suites
+        self.prepare_suite = prepare_suite
+        self.run_suite = run_suite
+        self.max_workers = max_workers
+
+        self.upstreams = load_lineage_graph(lineage_path)
+        for dataset in validation_suites:
+            if dataset not in self.upstreams:
+                print(f"Warning: {dataset} has a validation suite but is not in lineage.yaml, it will run without dependencies")
+                self.upstreams[dataset] = set()
+
+        self.downstreams = {dataset: set() for dataset in self.upstreams}
+        for dataset, sources in self.upstreams.items():
+            for source in sources:
+                self.downstreams[source].add(dataset)
+
+        self.check_acyclic()
+
+    def check_acyclic(self) -> None:
+        """Raise ValueError if the lineage graph contains a cycle."""
+        remaining = {dataset: len(sources) for dataset, sources in self.upstreams.items()}
+        ready = [dataset for dataset, count in remaining.items() if count == 0]
+        visited = 0
+        while ready:
+            dataset = ready.pop()
+            visited += 1
+            for child in self.downstreams[dataset]:
+                remaining[child] -= 1
+                if remaining[child] == 0:
+                    ready.append(child)
+        if visited != len(remaining):
+            cyclic = sorted(dataset for dataset, count in remaining.items() if count > 0)
+            raise ValueError(f"Lineage graph contains a cycle involving: {cyclic}")
+
+    def resolve_dataset(self, table: str) -> str:
+        """
+        Return the dataset matching a full dataset name or a unique trailing
+        part of one, e.g. public.pos_sales or pos_sales.
+        """
+        if table in self.upstreams:
+            return table
+        matches = [dataset for dataset in self.upstreams if dataset.endswith(f".{table}")]
+        if not matches:
+            raise ValueError(f"Table {table} not found in lineage or validation suites")
+        if len(matches) > 1:
+            raise ValueError(f"Table {table} is ambiguous, use one of: {sorted(matches)}")
+        return matches[0]
+
+    def affected_datasets(self, changed_tables) -> set:
+        """Return the changed datasets and everything downstream of them."""
+        if isinstance(changed_tables, str):
+            changed_tables = [changed_tables]
+
+        affected = set()
+        pending = [self.resolve_dataset(table) for table in changed_tables]
+        while pending:
+            dataset = pending.pop()
+            if dataset in affected:
+                continue
+            affected.add(dataset)
+            pending.extend(self.downstreams[dataset])
+        return affected
+
+    @staticmethod
+    def ready_datasets(datasets: set, remaining: dict, statuses: dict, running: dict) -> list:
+        """Return datasets whose upstreams have all passed and that have not started."""
+        in_progress = set(running.values())
+        return sorted(
+            dataset for dataset in datasets
+            if not remaining[dataset] and dataset not in statuses and dataset not in in_progress
+        )
+
+    def run(self, changed_tables=None) -> dict:
+        """
+        Run validation suites in dependency order and return dataset -> status.
+
+        changed_tables may be a single table or a list. If given, only those
+        tables and their downstream tables are validated; upstream tables
+        outside that subgraph are assumed to be unchanged and are not re-run.
+        """
+        if changed_tables:
+            datasets = self.affected_datasets(changed_tables)
+        else:
+            datasets = set(self.upstreams)
+
+        # Only wait on upstreams that are part of this run
+        remaining = {dataset: self.upstreams[dataset] & datasets for dataset in datasets}
+        statuses = {}
+        running = {}
+
+        def settle(dataset, status):
+            statuses[dataset] = status
+            for child in self.downstreams[dataset] & datasets:
+                if status == FAILED or status == SKIPPED:
+                    remaining[child] = set()
+                    if child not in statuses:
+                        print(f"Skipping {child}: upstream {dataset} {status}")
+                        settle(child, SKIPPED)
+                    continue
+                remaining[child].discard(dataset)
+
+        def schedule(executor):
+            """Settle suite-less datasets and submit ready suites while workers are free."""
+            progressed = True
+            while progressed:
+                progressed = False
+                for dataset in self.ready_datasets(datasets, remaining, statuses, running):
+                    if dataset not in self.validation_suites:
+                        # Datasets without a suite still pass dependencies through
+                        settle(dataset, NO_SUITE)
+                        progressed = True
+                        continue
+                    if len(running) >= self.max_workers:
+                        continue
+                    # Prepare lazily so suites that end up skipped cost nothing
+                    try:
+                        prepared = self.prepare_suite(self.validation_suites[dataset])
+                    except Exception as e:
+                        print(f"Preparing validation for {dataset} failed: {str(e)}")
+                        settle(dataset, FAILED)
+                        progressed = True
+                        continue
+                    print(f"Scheduling validation for {dataset}")
+                    running[executor.submit(self.run_suite, prepared)] = dataset
+                    progressed = True
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while len(statuses) < len(datasets):
+                schedule(executor)
+
+                if not running:
+                    if len(statuses) < len(datasets):
+                        unsettled = sorted(datasets - set(statuses))
+                        raise RuntimeError(f"Scheduler stalled with unsettled datasets: {unsettled}")
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    dataset = running.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        print(f"Validation for {dataset} failed: {str(e)}")
+                        settle(dataset, FAILED)
+                        continue
+                    if getattr(result, "success", None) is False:
+                        print(f"Validation for {dataset} failed expectations")
+                        settle(dataset, FAILED)
+                    else:
+                        settle(dataset, PASSED)
+
+        print("Validation schedule complete:")
+        for dataset in sorted(statuses):
+            print(f"  {dataset}: {statuses[dataset]}")
+        return statuses
@@ -1,7 +1,8 @@
 """
 This package contains validation suites for different database tables.
 Each validation module should implement a run_validation(context) function
-that returns a tuple of (batch_request, suite_name).
+that returns a tuple of (batch_request, suite_name, datasource_config), and
+define DATASET as the database.schema.table name used in lineage.yaml.
 """
 
 from pathlib import Path
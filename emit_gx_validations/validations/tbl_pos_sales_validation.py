@@ -4,6 +4,9 @@ from great_expectations.core.expectation_suite import ExpectationSuite
 from datetime import datetime
 import os
 
+# Dataset this suite validates, as named in emit_lineage/lineage.yaml
+DATASET = "postgres.public.pos_sales"
+
 def run_validation(context):
     if context is None:
         raise ValueError("Context cannot be None")